@@ -3,8 +3,10 @@ Configuration settings for the YouTube to Blog Converter API
 """
 
 import os
-from typing import Optional
-from dotenv import load_dotenv
+import pickle
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from dotenv import dotenv_values
 from pathlib import Path
 
 # Find the project root directory (where .env should be)
@@ -13,57 +15,93 @@ project_root = current_dir.parent    # project root directory
 
 # Load environment variables from project root
 env_path = project_root / ".env"
-load_dotenv(dotenv_path=env_path)
+env_cache_path = project_root / ".env.cache.pkl"
+
+def _load_env(env_path: Path, cache_path: Path) -> None:
+    """Load .env into os.environ, reusing a parsed copy keyed by the file's mtime"""
+    try:
+        mtime = env_path.stat().st_mtime_ns
+    except OSError:
+        return
+    
+    try:
+        cached_mtime, values = pickle.loads(cache_path.read_bytes())
+    except Exception:
+        cached_mtime, values = None, None
+    
+    if cached_mtime != mtime:
+        values = {k: v for k, v in dotenv_values(env_path).items() if v is not None}
+        try:
+            cache_path.write_bytes(pickle.dumps((mtime, values)))
+        except OSError:
+            pass
+    
+    # Same semantics as load_dotenv: never override variables already set
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+_load_env(env_path, env_cache_path)
 
 print(f"🔧 Config: Looking for .env at: {env_path}")
 print(f"🔧 Config: .env exists: {env_path.exists()}")
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings"""
+    """Application settings, resolved once at import time"""
     
     # Server configuration
-    HOST: str = os.getenv("HOST", "localhost")
-    PORT: int = int(os.getenv("PORT", "8000"))
-    DEBUG: bool = os.getenv("DEBUG", "True").lower() == "true"
+    HOST: str
+    PORT: int
+    DEBUG: bool
     
     # API Keys
-    YOUTUBE_API_KEY: Optional[str] = os.getenv("YOUTUBE_API_KEY")
-    OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
-    NEBIUS_API_KEY: Optional[str] = os.getenv("NEBIUS_API_KEY")
+    YOUTUBE_API_KEY: Optional[str]
+    OPENAI_API_KEY: Optional[str]
+    NEBIUS_API_KEY: Optional[str]
+    
+    # Precomputed feature flags
+    is_development: bool
+    has_youtube_api: bool
+    has_openai_api: bool
+    has_nebius_api: bool
     
     # CORS settings
-    CORS_ORIGINS: list = [
+    CORS_ORIGINS: Tuple[str, ...] = (
         "http://localhost:3000",
         "http://localhost:8080", 
         "https://ytblogs.netlify.app",
         "https://*.netlify.app",
         "*"  # Allow all origins for development (remove in production)
-    ]
+    )
     
     # Application metadata
     APP_NAME: str = "YouTube to Blog Converter API"
     VERSION: str = "1.0.0"
     DESCRIPTION: str = "Convert YouTube videos into well-structured blog posts"
-    
-    @property
-    def is_development(self) -> bool:
-        """Check if running in development mode"""
-        return self.DEBUG
-    
-    @property
-    def has_youtube_api(self) -> bool:
-        """Check if YouTube API key is configured"""
-        return self.YOUTUBE_API_KEY is not None and len(self.YOUTUBE_API_KEY.strip()) > 0
-    
-    @property
-    def has_openai_api(self) -> bool:
-        """Check if OpenAI API key is configured"""
-        return self.OPENAI_API_KEY is not None and len(self.OPENAI_API_KEY.strip()) > 0
 
-    @property
-    def has_nebius_api(self) -> bool:
-        """Check if Nebius API key is configured"""
-        return self.NEBIUS_API_KEY is not None and len(self.NEBIUS_API_KEY.strip()) > 0
+def _has_key(value: Optional[str]) -> bool:
+    """Check if an API key is present and non-blank"""
+    return bool(value and value.strip())
+
+def _load_settings() -> Settings:
+    """Read the environment once and build the settings instance"""
+    debug = os.getenv("DEBUG", "True").lower() == "true"
+    youtube_api_key = os.getenv("YOUTUBE_API_KEY")
+    openai_api_key = os.getenv("OPENAI_API_KEY")
+    nebius_api_key = os.getenv("NEBIUS_API_KEY")
+    
+    return Settings(
+        HOST=os.getenv("HOST", "localhost"),
+        PORT=int(os.getenv("PORT", "8000")),
+        DEBUG=debug,
+        YOUTUBE_API_KEY=youtube_api_key,
+        OPENAI_API_KEY=openai_api_key,
+        NEBIUS_API_KEY=nebius_api_key,
+        is_development=debug,
+        has_youtube_api=_has_key(youtube_api_key),
+        has_openai_api=_has_key(openai_api_key),
+        has_nebius_api=_has_key(nebius_api_key),
+    )
 
 # Global settings instance
-settings = Settings() 
\ No newline at end of file
+settings = _load_settings()
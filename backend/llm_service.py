@@ -1,8 +1,14 @@
 import os
-from openai import OpenAI
-from typing import Optional
+import json
+import logging
+import threading
+from typing import Optional, AsyncIterator
 from backend.config import settings
 
+logger = logging.getLogger(__name__)
+
+NEBIUS_BASE_URL = "https://api.studio.nebius.ai/v1/"
+
 class LLMService:
     """
     A service to interact with a Large Language Model via the Nebius AI Studio API.
@@ -16,13 +22,53 @@ class LLMService:
             print("❌ ERROR: NEBIUS_API_KEY is not configured in the .env file.")
             raise ValueError("NEBIUS_API_KEY is not configured.")
         
+        # Imported here so the openai SDK only loads when the LLM is actually configured
+        import httpx
+        from openai import OpenAI, AsyncOpenAI
+        
+        # Long-lived HTTP/2 connection pool so generations reuse the TLS session
+        self.http_client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=300),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
         self.client = OpenAI(
-            base_url="https://api.studio.nebius.ai/v1/",
+            base_url=NEBIUS_BASE_URL,
             api_key=settings.NEBIUS_API_KEY,
+            http_client=self.http_client,
+        )
+        # Async twin used to issue several generations concurrently
+        self.async_client = AsyncOpenAI(
+            base_url=NEBIUS_BASE_URL,
+            api_key=settings.NEBIUS_API_KEY,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=300),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            ),
         )
         # Model specified in the user's example
         self.model = "meta-llama/Llama-3.3-70B-Instruct"
+        self.temperature = 0.7  # A bit of creativity
+        self.max_tokens = 3072  # Generous token limit for detailed blogs
+        # Constant leading fields of a chat completion body, encoded once (see generate_from_body)
+        self.request_prefix = json.dumps({
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+        })[:-1].encode()
         print("🤖 LLM Service Initialized successfully with Nebius AI Studio.")
+        
+        # Open the pooled connection in the background so the first generation skips the TLS handshake
+        threading.Thread(target=self._prewarm, name="llm-prewarm", daemon=True).start()
+
+    def _prewarm(self) -> None:
+        """Establish a keep-alive connection to the Nebius API; failures are only logged."""
+        try:
+            self.http_client.options(NEBIUS_BASE_URL)
+            logger.debug("LLM connection pre-warmed")
+        except Exception as e:
+            logger.debug("LLM connection pre-warm failed: %s", e)
 
     def generate_content(self, system_prompt: str, user_prompt: str) -> str:
         """
@@ -36,20 +82,109 @@ class LLMService:
             The generated content as a string, or an error message if generation fails.
         """
         try:
-            print(f"🧠 Sending prompt to LLM ('{self.model}')...")
+            logger.debug("Sending prompt to LLM (%s)", self.model)
             completion = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt},
                 ],
-                temperature=0.7,  # A bit of creativity
-                max_tokens=3072, # Generous token limit for detailed blogs
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
             )
-            print("✅ LLM response received.")
+            logger.debug("LLM response received")
             return completion.choices[0].message.content
         except Exception as e:
-            error_message = f"❌ LLM generation failed: {e}"
-            print(error_message)
+            logger.error("LLM generation failed: %s", e)
             # Return a user-friendly error message in Markdown format
-            return f"## Error During Blog Generation\n\nAn error occurred while communicating with the AI model:\n\n`{str(e)}`" 
\ No newline at end of file
+            return f"## Error During Blog Generation\n\nAn error occurred while communicating with the AI model:\n\n`{str(e)}`" 
+
+    def generate_from_body(self, body: bytes) -> str:
+        """
+        Generates content from a pre-encoded chat completion request body.
+
+        The body is sent as-is on the pooled HTTP client, so callers that keep
+        constant parts of the request (such as system prompts) already encoded
+        avoid re-serializing them on every call.
+
+        Args:
+            body: The JSON request body, starting with request_prefix.
+
+        Returns:
+            The generated content as a string, or an error message if generation fails.
+        """
+        try:
+            logger.debug("Sending pre-encoded prompt to LLM (%s)", self.model)
+            response = self.http_client.post(
+                f"{NEBIUS_BASE_URL}chat/completions",
+                content=body,
+                headers={
+                    "Authorization": f"Bearer {settings.NEBIUS_API_KEY}",
+                    "Content-Type": "application/json",
+                },
+            )
+            response.raise_for_status()
+            logger.debug("LLM response received")
+            return response.json()["choices"][0]["message"]["content"]
+        except Exception as e:
+            logger.error("LLM generation failed: %s", e)
+            return f"## Error During Blog Generation\n\nAn error occurred while communicating with the AI model:\n\n`{str(e)}`"
+
+    async def agenerate_content(self, system_prompt: str, user_prompt: str) -> str:
+        """
+        Async variant of generate_content, so several prompts can be in flight at once.
+
+        Args:
+            system_prompt: The instructions for the AI's role and behavior.
+            user_prompt: The specific request or data for the AI to process.
+
+        Returns:
+            The generated content as a string, or an error message if generation fails.
+        """
+        try:
+            logger.debug("Sending async prompt to LLM (%s)", self.model)
+            completion = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+            )
+            logger.debug("Async LLM response received")
+            return completion.choices[0].message.content
+        except Exception as e:
+            logger.error("Async LLM generation failed: %s", e)
+            return f"## Error During Blog Generation\n\nAn error occurred while communicating with the AI model:\n\n`{str(e)}`"
+
+    async def stream_content(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """
+        Streams content from the configured LLM as it is generated.
+
+        Args:
+            system_prompt: The instructions for the AI's role and behavior.
+            user_prompt: The specific request or data for the AI to process.
+
+        Yields:
+            Text fragments as they arrive, or a single error message if generation fails.
+        """
+        try:
+            logger.debug("Streaming prompt to LLM (%s)", self.model)
+            stream = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+            logger.debug("LLM stream finished")
+        except Exception as e:
+            logger.error("LLM streaming failed: %s", e)
+            yield f"## Error During Blog Generation\n\nAn error occurred while communicating with the AI model:\n\n`{str(e)}`"
@@ -1,10 +1,14 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, HttpUrl
+from fastapi.responses import FileResponse, StreamingResponse, ORJSONResponse
+from pydantic import BaseModel, ConfigDict, HttpUrl
 import asyncio
-from typing import Optional
+import json
+import logging
+import re
+import time
+from typing import Optional, List, Dict
 import sys
 import os
 
@@ -17,33 +21,58 @@ from backend.youtube_service import YouTubeService
 from backend.config import settings
 from utils.blog_generator import BlogGenerator
 
+# Configure application logging once; service modules only create named loggers
+logging.basicConfig(
+    level=logging.DEBUG if settings.is_development else logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+
 app = FastAPI(
     title=settings.APP_NAME, 
     version=settings.VERSION,
-    description=settings.DESCRIPTION
+    description=settings.DESCRIPTION,
+    default_response_class=ORJSONResponse
 )
 
-# Enable CORS for frontend communication
+# Enable CORS for frontend communication; the middleware also answers preflight requests.
+# Credentials cannot be combined with a wildcard origin, so only allow them for a concrete origin list.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_credentials="*" not in settings.CORS_ORIGINS,
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type"],
 )
 
 # Initialize services with configuration
 youtube_service = YouTubeService(api_key=settings.YOUTUBE_API_KEY)
 blog_generator = BlogGenerator()
 
+@app.on_event("shutdown")
+async def close_services():
+    """Release pooled HTTP connections on shutdown"""
+    await youtube_service.aclose()
+
+# Counts whitespace-separated words without building a list of them
+_WORD_RE = re.compile(r'\S+')
+
+def count_words(text: str) -> int:
+    """Count words in generated content"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
 # Mount static files (for serving frontend assets)
 app.mount("/public", StaticFiles(directory="public"), name="public")
 
 class VideoRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     url: HttpUrl
     template: str = "article"
 
+# Responses are built from our own service data with model_construct, skipping validation
 class VideoResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     title: str
     description: str
     thumbnail: str
@@ -54,10 +83,23 @@ class VideoResponse(BaseModel):
     video_id: str
 
 class BlogResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     content: str
     template: str
     word_count: int
 
+class BatchVideoRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
+    url: HttpUrl
+    templates: List[str]
+
+class BatchBlogResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
+    blogs: Dict[str, BlogResponse]
+
 @app.get("/")
 async def serve_frontend():
     """Serve the main frontend HTML file"""
@@ -76,11 +118,6 @@ async def api_status():
         "cors_origins": settings.CORS_ORIGINS
     }
 
-@app.options("/{path:path}")
-async def options_handler(path: str):
-    """Handle CORS preflight requests"""
-    return {"message": "OK"}
-
 @app.post("/api/video-info", response_model=VideoResponse)
 async def get_video_info(request: VideoRequest):
     """Extract video information from YouTube URL"""
@@ -89,11 +126,8 @@ async def get_video_info(request: VideoRequest):
         if not video_id:
             raise HTTPException(status_code=400, detail="Invalid YouTube URL")
         
-        # Simulate API processing delay for better UX
-        await asyncio.sleep(1)
-        
-        video_data = youtube_service.get_video_metadata(video_id)
-        return VideoResponse(**video_data)
+        video_data = await youtube_service.get_video_metadata(video_id)
+        return VideoResponse.model_construct(**video_data)
         
     except HTTPException:
         raise
@@ -114,20 +148,21 @@ async def generate_blog(request: VideoRequest):
         if not video_id:
             raise HTTPException(status_code=400, detail="Invalid YouTube URL")
         
-        # Simulate processing delay for better UX
-        await asyncio.sleep(2)
-        
-        # Get video metadata and transcript
-        video_data = youtube_service.get_video_metadata(video_id)
-        transcript = youtube_service.get_transcript(video_id)
+        # Get video metadata and transcript concurrently
+        video_data, transcript = await asyncio.gather(
+            youtube_service.get_video_metadata(video_id),
+            youtube_service.get_transcript(video_id)
+        )
         
-        # Generate blog content
-        blog_content = blog_generator.generate_blog(video_data, request.template, transcript)
+        # Generate blog content (the LLM client is blocking, keep it off the event loop)
+        blog_content = await asyncio.to_thread(
+            blog_generator.generate_blog, video_data, request.template, transcript
+        )
         
         # Calculate word count
-        word_count = len(blog_content.split())
+        word_count = count_words(blog_content)
         
-        return BlogResponse(
+        return BlogResponse.model_construct(
             content=blog_content,
             template=request.template,
             word_count=word_count
@@ -138,6 +173,78 @@ async def generate_blog(request: VideoRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating blog: {str(e)}")
 
+@app.post("/api/generate-blogs", response_model=BatchBlogResponse)
+async def generate_blogs(request: BatchVideoRequest):
+    """Generate several blog templates for one video, with the LLM calls issued concurrently"""
+    if not blog_generator.llm_enabled:
+        raise HTTPException(
+            status_code=503, 
+            detail="LLM Service Unavailable: NEBIUS_API_KEY is not configured on the server."
+        )
+    unknown = [t for t in request.templates if t not in blog_generator.templates]
+    if not request.templates or unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown or missing templates: {unknown}")
+
+    try:
+        video_id = youtube_service.extract_video_id(str(request.url))
+        if not video_id:
+            raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+        
+        video_data, transcript = await asyncio.gather(
+            youtube_service.get_video_metadata(video_id),
+            youtube_service.get_transcript(video_id)
+        )
+        
+        contents = await blog_generator.generate_blogs(video_data, request.templates, transcript)
+        
+        return BatchBlogResponse.model_construct(blogs={
+            template: BlogResponse.model_construct(
+                content=content,
+                template=template,
+                word_count=count_words(content)
+            )
+            for template, content in contents.items()
+        })
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating blogs: {str(e)}")
+
+@app.post("/api/generate-blog/stream")
+async def generate_blog_stream(request: VideoRequest):
+    """Stream blog content as server-sent events while the LLM generates it"""
+    if not blog_generator.llm_enabled:
+        raise HTTPException(
+            status_code=503, 
+            detail="LLM Service Unavailable: NEBIUS_API_KEY is not configured on the server."
+        )
+    if request.template not in blog_generator.templates:
+        raise HTTPException(status_code=400, detail=f"Unknown template: {request.template}")
+
+    video_id = youtube_service.extract_video_id(str(request.url))
+    if not video_id:
+        raise HTTPException(status_code=400, detail="Invalid YouTube URL")
+
+    try:
+        video_data, transcript = await asyncio.gather(
+            youtube_service.get_video_metadata(video_id),
+            youtube_service.get_transcript(video_id)
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating blog: {str(e)}")
+
+    async def events():
+        # Each fragment is a JSON-encoded "data" event; a final "done" event carries the word count
+        fragments = []
+        async for fragment in blog_generator.generate_blog_stream(video_data, request.template, transcript):
+            fragments.append(fragment)
+            yield f"data: {json.dumps(fragment)}\n\n"
+        summary = {"template": request.template, "word_count": count_words("".join(fragments))}
+        yield f"event: done\ndata: {json.dumps(summary)}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 @app.get("/api/templates")
 async def get_templates():
     """Get available blog templates"""
@@ -166,9 +273,28 @@ async def get_templates():
         ]
     }
 
+# Last deep health check result, reused for HEALTH_CACHE_TTL seconds
+HEALTH_CACHE_TTL = 30
+_health_cache = {"ts": 0.0, "body": None}
+
 @app.get("/api/health")
-async def health_check():
-    """Detailed health check endpoint"""
+async def health_check(deep: bool = False):
+    """Health check endpoint; pass ?deep=true to exercise the external services"""
+    if not deep:
+        # Cheap structural check for load balancer / orchestrator probes
+        return {
+            "status": "healthy",
+            "services": {
+                "youtube_service": "configured" if youtube_service.has_api_key else "fallback",
+                "blog_generator": "ready" if blog_generator.llm_enabled else "disabled"
+            },
+            "api_version": "1.0.0"
+        }
+    
+    now = time.monotonic()
+    if _health_cache["body"] is not None and now - _health_cache["ts"] < HEALTH_CACHE_TTL:
+        return _health_cache["body"]
+    
     try:
         # Test if services are working
         test_video_id = "dQw4w9WgXcQ"  # Rick Roll video ID for testing
@@ -176,7 +302,7 @@ async def health_check():
         # Test YouTube service
         youtube_working = True
         try:
-            youtube_service.get_video_metadata(test_video_id)
+            await youtube_service.get_video_metadata(test_video_id)
         except:
             youtube_working = False
         
@@ -185,11 +311,11 @@ async def health_check():
         try:
             mock_data = {"title": "Test", "description": "Test", "channel_name": "Test", 
                         "duration": "1:00", "views": "100", "published_at": "2024-01-01", "video_id": "test"}
-            blog_generator.generate_blog(mock_data, "article", "test transcript")
+            await asyncio.to_thread(blog_generator.generate_blog, mock_data, "article", "test transcript")
         except:
             blog_working = False
         
-        return {
+        body = {
             "status": "healthy",
             "services": {
                 "youtube_service": "operational" if youtube_working else "degraded",
@@ -197,6 +323,8 @@ async def health_check():
             },
             "api_version": "1.0.0"
         }
+        _health_cache.update(ts=now, body=body)
+        return body
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Health check failed: {str(e)}")
 
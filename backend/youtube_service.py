@@ -1,92 +1,154 @@
 import os
 import re
-from typing import Optional, Dict, Any
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 import json
-from pytube import YouTube
-from youtube_transcript_api import YouTubeTranscriptApi, NoTranscriptFound, TranscriptsDisabled
-import requests
+import httpx
 from xml.etree.ElementTree import ParseError
 
+logger = logging.getLogger(__name__)
+
+# Matches watch, embed, v/, shorts and youtu.be URLs in a single scan
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube\.com/(?:watch\?(?:.*&)?v=|embed/|v/|shorts/)|youtu\.be/)([^&\n?#/]{11})'
+)
+
+# Bracketed content like [Music], parenthetical asides and common filler words
+_TRANSCRIPT_NOISE_RE = re.compile(
+    r'\[[^\]]*\]|\([^)]*\)|\b(?:um|uh|like|you know|so basically|okay|alright)\b',
+    re.IGNORECASE
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+class _TTLCache:
+    """Small bounded cache whose entries expire after a fixed number of seconds"""
+    
+    def __init__(self, maxsize: int = 512, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return (hit, value) for key, dropping it if it has expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return False, None
+        self._data.move_to_end(key)
+        return True, value
+    
+    def set(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
 class YouTubeService:
     """Service for handling YouTube video operations"""
     
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv('YOUTUBE_API_KEY')
+        self.has_api_key = bool(self.api_key and self.api_key.strip())
         self.base_url = 'https://www.googleapis.com/youtube/v3'
         
+        # Per-video caches so /api/video-info followed by /api/generate-blog
+        # for the same URL doesn't repeat the network round-trips
+        self._metadata_cache = _TTLCache(maxsize=512, ttl=3600)
+        self._transcript_cache = _TTLCache(maxsize=512, ttl=3600)
+        
+        # Shared async client for the YouTube Data API; keep-alive connections
+        # are reused across requests so each call skips the TLS handshake
+        self._http = httpx.AsyncClient(
+            timeout=10,
+            headers={'Accept': 'application/json'},
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        )
+        
         # Debug logging
         print(f"🔧 YouTubeService initialized")
         print(f"🔑 API Key configured: {'Yes' if self.api_key else 'No (will use PyTube fallback)'}")
         
-        # Check if yt-dlp is available as additional fallback
-        try:
-            import yt_dlp
-            self.has_ytdlp = True
-            print("🔧 yt-dlp available as additional fallback")
-        except ImportError:
-            self.has_ytdlp = False
-            print("🔧 yt-dlp not available (install with: pip install yt-dlp)")
+        # Whether yt-dlp is installed; resolved on first use to keep its import off startup
+        self.has_ytdlp: Optional[bool] = None
         
     def extract_video_id(self, url: str) -> Optional[str]:
         """Extract YouTube video ID from various URL formats"""
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)([^&\n?#]+)',
-            r'youtube\.com\/watch\?.*v=([^&\n?#]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, str(url))
-            if match:
-                video_id = match.group(1)
-                print(f"🎥 Extracted video ID: {video_id}")
-                return video_id
-        print(f"❌ Could not extract video ID from URL: {url}")
+        match = _VIDEO_ID_RE.search(str(url))
+        if match:
+            video_id = match.group(1)
+            logger.debug("Extracted video ID: %s", video_id)
+            return video_id
+        logger.debug("Could not extract video ID from URL: %s", url)
         return None
     
     def validate_youtube_url(self, url: str) -> bool:
         """Validate if the provided URL is a valid YouTube URL"""
         return self.extract_video_id(url) is not None
     
-    def get_video_metadata(self, video_id: str) -> Dict[str, Any]:
-        """Get video metadata from YouTube Data API or PyTube as fallback"""
-        print(f"🔍 Getting metadata for video ID: {video_id}")
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client"""
+        await self._http.aclose()
+    
+    async def get_video_metadata(self, video_id: str) -> Dict[str, Any]:
+        """Get video metadata, served from the per-video cache when possible"""
+        hit, cached = self._metadata_cache.get(video_id)
+        if hit:
+            return dict(cached)
+        
+        result = await self._fetch_video_metadata(video_id)
+        if result is None:
+            # Mock data is never cached so the next request retries the real sources
+            logger.warning("Using mock metadata as final fallback for %s", video_id)
+            return self._get_mock_metadata(video_id)
+        
+        self._metadata_cache.set(video_id, result)
+        return dict(result)
+    
+    async def _fetch_video_metadata(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """Get video metadata from YouTube Data API or PyTube as fallback, or None if every source fails"""
+        logger.debug("Getting metadata for video ID: %s", video_id)
         
         # Try YouTube Data API first if API key is available
-        if self.api_key and self.api_key.strip():
-            print("🌐 Trying YouTube Data API...")
+        if self.has_api_key:
+            logger.debug("Trying YouTube Data API")
             try:
-                result = self._get_metadata_from_api(video_id)
-                print("✅ Successfully got metadata from YouTube Data API")
+                result = await self._get_metadata_from_api(video_id)
+                logger.debug("Got metadata from YouTube Data API")
                 return result
             except Exception as e:
-                print(f"❌ YouTube Data API failed: {e}")
-                print("🔄 Falling back to PyTube...")
+                logger.warning("YouTube Data API failed, falling back to PyTube: %s", e)
         else:
-            print("🔄 No API key found, using PyTube...")
+            logger.debug("No API key found, using PyTube")
         
         # Try PyTube as fallback
         try:
-            result = self._get_metadata_from_pytube(video_id)
-            print("✅ Successfully got metadata from PyTube")
+            # PyTube and yt-dlp are blocking, so run them off the event loop
+            result = await asyncio.to_thread(self._get_metadata_from_pytube, video_id)
+            logger.debug("Got metadata from PyTube")
             return result
         except Exception as e:
-            print(f"❌ PyTube also failed: {e}")
+            logger.warning("PyTube also failed: %s", e)
             
             # Try yt-dlp as additional fallback if available
-            if self.has_ytdlp:
-                print("🔄 Trying yt-dlp as additional fallback...")
+            if self.has_ytdlp is not False:
+                logger.debug("Trying yt-dlp as additional fallback")
                 try:
-                    result = self._get_metadata_from_ytdlp(video_id)
-                    print("✅ Successfully got metadata from yt-dlp")
+                    result = await asyncio.to_thread(self._get_metadata_from_ytdlp, video_id)
+                    logger.debug("Got metadata from yt-dlp")
                     return result
                 except Exception as ytdlp_error:
-                    print(f"❌ yt-dlp also failed: {ytdlp_error}")
+                    logger.warning("yt-dlp also failed: %s", ytdlp_error)
             
-            print("🔄 Using mock data as final fallback")
-            return self._get_mock_metadata(video_id)
+            return None
     
-    def _get_metadata_from_api(self, video_id: str) -> Dict[str, Any]:
+    async def _get_metadata_from_api(self, video_id: str) -> Dict[str, Any]:
         """Get metadata using YouTube Data API"""
         url = f"{self.base_url}/videos"
         params = {
@@ -95,8 +157,8 @@ class YouTubeService:
             'part': 'snippet,statistics,contentDetails'
         }
         
-        print(f"🌐 Making API request to: {url}")
-        response = requests.get(url, params=params, timeout=10)
+        logger.debug("Making API request to: %s", url)
+        response = await self._http.get(url, params=params)
         
         if response.status_code != 200:
             raise Exception(f"API request failed with status {response.status_code}: {response.text}")
@@ -134,9 +196,11 @@ class YouTubeService:
     def _get_metadata_from_pytube(self, video_id: str) -> Dict[str, Any]:
         """Get metadata using PyTube as fallback"""
         url = f"https://www.youtube.com/watch?v={video_id}"
-        print(f"🎥 Fetching from PyTube: {url}")
+        logger.debug("Fetching from PyTube: %s", url)
         
         try:
+            from pytube import YouTube
+            
             yt = YouTube(url, use_oauth=False, allow_oauth_cache=False)
             
             # Try to access basic properties to trigger any errors early
@@ -148,7 +212,7 @@ class YouTubeService:
             description = yt.description
             thumbnail = yt.thumbnail_url
             
-            print(f"📊 PyTube data: Title='{title}', Author='{author}', Length={length}s")
+            logger.debug("PyTube data: Title=%r, Author=%r, Length=%ss", title, author, length)
             
             # Format duration
             duration = self._seconds_to_duration(length)
@@ -171,16 +235,17 @@ class YouTubeService:
             }
         
         except Exception as e:
-            print(f"❌ PyTube detailed error: {type(e).__name__}: {str(e)}")
+            logger.debug("PyTube detailed error: %s: %s", type(e).__name__, e)
             raise e
     
     def _get_metadata_from_ytdlp(self, video_id: str) -> Dict[str, Any]:
         """Get metadata using yt-dlp as additional fallback"""
         try:
             import yt_dlp
+            self.has_ytdlp = True
             
             url = f"https://www.youtube.com/watch?v={video_id}"
-            print(f"🎥 Fetching from yt-dlp: {url}")
+            logger.debug("Fetching from yt-dlp: %s", url)
             
             ydl_opts = {
                 'quiet': True,
@@ -199,7 +264,7 @@ class YouTubeService:
                 upload_date = info.get('upload_date', datetime.now().strftime('%Y%m%d'))
                 thumbnail = info.get('thumbnail', f'https://img.youtube.com/vi/{video_id}/maxresdefault.jpg')
                 
-                print(f"📊 yt-dlp data: Title='{title}', Uploader='{uploader}', Duration={duration_seconds}s")
+                logger.debug("yt-dlp data: Title=%r, Uploader=%r, Duration=%ss", title, uploader, duration_seconds)
                 
                 # Format duration
                 duration = self._seconds_to_duration(duration_seconds)
@@ -225,14 +290,15 @@ class YouTubeService:
                 }
         
         except ImportError:
+            self.has_ytdlp = False
+            logger.info("yt-dlp not available (install with: pip install yt-dlp)")
             raise Exception("yt-dlp not installed")
         except Exception as e:
-            print(f"❌ yt-dlp detailed error: {type(e).__name__}: {str(e)}")
+            logger.debug("yt-dlp detailed error: %s: %s", type(e).__name__, e)
             raise e
     
     def _get_mock_metadata(self, video_id: str) -> Dict[str, Any]:
         """Return mock metadata as final fallback"""
-        print("⚠️  Using mock metadata - both API and PyTube failed")
         return {
             'title': 'YouTube Video (Unable to fetch title)',
             'description': 'Unable to fetch video description at this time.',
@@ -244,78 +310,73 @@ class YouTubeService:
             'video_id': video_id
         }
     
-    def get_transcript(self, video_id: str) -> str:
+    async def get_transcript(self, video_id: str) -> Optional[str]:
+        """Get video transcript, served from the per-video cache when possible"""
+        hit, cached = self._transcript_cache.get(video_id)
+        if hit:
+            return cached
+        
+        transcript = await asyncio.to_thread(self._fetch_transcript, video_id)
+        if transcript is not None:
+            self._transcript_cache.set(video_id, transcript)
+        return transcript
+    
+    def _fetch_transcript(self, video_id: str) -> Optional[str]:
         """Get video transcript using youtube-transcript-api"""
-        print(f"📝 Getting transcript for video ID: {video_id}")
+        from youtube_transcript_api import YouTubeTranscriptApi, NoTranscriptFound, TranscriptsDisabled
+        
+        logger.debug("Getting transcript for video ID: %s", video_id)
         
         try:
-            # Try to get transcript in different languages
-            languages = ['en', 'en-US', 'en-GB']  # Try English variants first
+            # Try English variants first; find_transcript checks them in order in a single lookup
+            languages = ['en', 'en-US', 'en-GB']
             transcript_list = None
             
             # Find available transcripts to be more robust
             available_transcripts = YouTubeTranscriptApi.list_transcripts(video_id)
             
-            for lang in languages:
-                try:
-                    transcript = available_transcripts.find_transcript([lang])
-                    transcript_list = transcript.fetch()
-                    print(f"✅ Got transcript in language: {lang}")
-                    break
-                except NoTranscriptFound:
-                    continue
+            try:
+                transcript = available_transcripts.find_transcript(languages)
+                transcript_list = transcript.fetch()
+                logger.debug("Got transcript in language: %s", transcript.language_code)
+            except NoTranscriptFound:
+                pass
 
             # If no specific language worked, try any available transcript
             if not transcript_list:
                 for transcript in available_transcripts:
                     transcript_list = transcript.fetch()
-                    print(f"✅ Got auto-generated transcript in language: {transcript.language_code}")
+                    logger.debug("Got auto-generated transcript in language: %s", transcript.language_code)
                     break
 
             if not transcript_list:
                 raise NoTranscriptFound("No suitable transcript found for this video.")
 
             # Combine all transcript segments
-            full_transcript = ' '.join([item['text'] for item in transcript_list])
+            full_transcript = ' '.join(item['text'] for item in transcript_list)
             
             # Clean up the transcript
             cleaned = self._clean_transcript(full_transcript)
-            print(f"📝 Transcript length: {len(cleaned)} characters")
+            logger.debug("Transcript length: %d characters", len(cleaned))
             
             return cleaned
             
         except (NoTranscriptFound, TranscriptsDisabled) as e:
-            print(f"❌ Transcript not available for video {video_id}: {type(e).__name__}")
-            print("🔄 Using sample transcript as fallback.")
+            logger.info("Transcript not available for video %s: %s", video_id, type(e).__name__)
             return self._get_sample_transcript()
         except ParseError as e:
-            print(f"❌ Transcript parsing failed for {video_id}. YouTube may have returned an invalid response. Error: {e}")
-            print("🔄 Using sample transcript as fallback.")
+            logger.warning("Transcript parsing failed for %s. YouTube may have returned an invalid response. Error: %s", video_id, e)
             return self._get_sample_transcript()
         except Exception as e:
-            print(f"❌ An unexpected transcript error occurred for {video_id}: {type(e).__name__}: {e}")
-            print("🔄 Using sample transcript as fallback.")
+            logger.warning("An unexpected transcript error occurred for %s: %s: %s", video_id, type(e).__name__, e)
             return self._get_sample_transcript()
     
     def _clean_transcript(self, transcript: str) -> str:
         """Clean and format transcript text"""
-        # Remove extra whitespace and normalize text
-        cleaned = re.sub(r'\s+', ' ', transcript.strip())
-        
-        # Remove common filler words and phrases (optional)
-        filler_patterns = [
-            r'\b(um|uh|like|you know|so basically|okay|alright)\b',
-            r'\[.*?\]',  # Remove bracketed content like [Music]
-            r'\(.*?\)'   # Remove parenthetical content
-        ]
-        
-        for pattern in filler_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-        
-        # Clean up extra spaces
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        
-        return cleaned
+        # Remove bracketed/parenthetical content and filler words in one pass,
+        # then normalize whitespace once
+        cleaned = _TRANSCRIPT_NOISE_RE.sub('', transcript)
+        return _WHITESPACE_RE.sub(' ', cleaned).strip()
     
     def _get_sample_transcript(self) -> None:
         """
@@ -325,28 +386,23 @@ class YouTubeService:
     
     def _parse_duration(self, duration_str: str) -> str:
         """Parse ISO 8601 duration (PT4M13S) to readable format (4:13)"""
-        import re
-        
-        # Remove PT prefix
-        duration_str = duration_str[2:]
-        
         hours = 0
         minutes = 0
         seconds = 0
+        number = 0
         
-        # Extract hours
-        if 'H' in duration_str:
-            hours = int(re.search(r'(\d+)H', duration_str).group(1))
-            duration_str = re.sub(r'\d+H', '', duration_str)
-        
-        # Extract minutes
-        if 'M' in duration_str:
-            minutes = int(re.search(r'(\d+)M', duration_str).group(1))
-            duration_str = re.sub(r'\d+M', '', duration_str)
-        
-        # Extract seconds
-        if 'S' in duration_str:
-            seconds = int(re.search(r'(\d+)S', duration_str).group(1))
+        # Single scan after the PT prefix, accumulating digits until a unit letter
+        for char in duration_str[2:]:
+            if char.isdigit():
+                number = number * 10 + (ord(char) - 48)
+            elif char == 'H':
+                hours, number = number, 0
+            elif char == 'M':
+                minutes, number = number, 0
+            elif char == 'S':
+                seconds, number = number, 0
+            else:
+                number = 0
         
         # Format duration
         if hours > 0:
@@ -7,10 +7,10 @@ import os
 import sys
 from pathlib import Path
 
-# Add project directories to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "backend"))
+# Add the project root to path (backend modules are imported as backend.*)
+project_root = str(Path(__file__).parent.resolve())
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 # Import and run the start script
 from start import main
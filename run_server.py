@@ -6,29 +6,59 @@ Provides multiple ways to start the server with proper configuration.
 
 import os
 import sys
-import uvicorn
-from pathlib import Path
+
+# Startup banner, pre-encoded once; placeholders are filled with bytes.replace
+_BANNER = (
+    "🚀 Starting YouTube to Blog Converter API Server...\n"
+    "📂 Project root: {root}\n"
+    "📂 Backend directory: {backend}\n"
+    "🌐 Server will be available at: http://localhost:8000\n"
+    "📖 API docs will be available at: http://localhost:8000/docs\n"
+    "{reload}\n"
+    + "-" * 50 + "\n"
+).encode("utf-8")
+_RELOAD_ON = "⚡ Hot reload enabled for development".encode("utf-8")
+_RELOAD_OFF = "⏸️ Hot reload disabled (ENV is not 'dev')".encode("utf-8")
 
 def main():
     """Main function to start the FastAPI server"""
+    # Heavy imports are deferred until the server is actually started
+    import uvicorn
+    from pathlib import Path
     
     # Keep working directory at project root for proper imports
-    project_root = Path(__file__).parent
+    project_root = Path(__file__).parent.resolve()
     backend_dir = project_root / "backend"
+    root_s = str(project_root)
     
     # Ensure we're in the project root
-    os.chdir(project_root)
+    if os.getcwd() != root_s:
+        os.chdir(root_s)
     
     # Add the project root to Python path for imports
-    sys.path.insert(0, str(project_root))
+    if root_s not in sys.path:
+        sys.path.insert(0, root_s)
+    
+    # Hot reload is opt-out: anything other than ENV=dev (the default) disables the file watcher
+    reload = os.environ.get("ENV", "dev") == "dev"
+    reload_options = dict(
+        reload=True,
+        # Only watch the Python source packages, not .git, assets or other large dirs
+        reload_dirs=[str(backend_dir), str(project_root / "utils")],
+        reload_includes=["*.py"],
+        reload_excludes=["*.pyc", "__pycache__/*", "node_modules/*", ".git/*", "*.log"],
+        reload_delay=0.5,
+    ) if reload else {}
     
-    print("🚀 Starting YouTube to Blog Converter API Server...")
-    print("📂 Project root:", project_root)
-    print("📂 Backend directory:", backend_dir)
-    print("🌐 Server will be available at: http://localhost:8000")
-    print("📖 API docs will be available at: http://localhost:8000/docs")
-    print("⚡ Hot reload enabled for development")
-    print("-" * 50)
+    # Emit the startup banner with a single write
+    banner = (
+        _BANNER
+        .replace(b"{root}", root_s.encode())
+        .replace(b"{backend}", str(backend_dir).encode())
+        .replace(b"{reload}", _RELOAD_ON if reload else _RELOAD_OFF)
+    )
+    sys.stdout.buffer.write(banner)
+    sys.stdout.buffer.flush()
     
     try:
         # Start the server with proper configuration
@@ -37,8 +67,11 @@ def main():
             "backend.main:app",  # Proper import path from project root
             host="0.0.0.0",
             port=8000,
-            reload=True,  # Enable hot reload for development
-            reload_dirs=[str(project_root)],  # Watch for changes in project directory
+            **reload_options,
+            loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows build
+            http="httptools",
+            ws="none",
+            lifespan="on",
             log_level="info"
         )
     except KeyboardInterrupt:
@@ -5,53 +5,68 @@ Production startup script for YouTube to Blog Converter
 
 import os
 import sys
-import uvicorn
-from pathlib import Path
+
+# Startup banner, pre-encoded once; placeholders are filled with bytes.replace
+_BANNER = (
+    "🚀 Starting YouTube to Blog Converter API Server on port {port}...\n"
+    "📂 Working directory: {cwd}\n"
+    "🐍 Python path: {path}\n"
+).encode("utf-8")
 
 def main():
     """Start the FastAPI server in production mode"""
+    # Heavy imports are deferred until the server is actually started
+    import uvicorn
+    from pathlib import Path
     
     # Get port from environment (Railway sets this)
     port = int(os.environ.get("PORT", 8000))
     
     # Ensure we're in the project root directory
-    project_root = Path(__file__).parent.absolute()
-    os.chdir(project_root)
+    project_root = Path(__file__).parent.resolve()
+    root_s = str(project_root)
+    if os.getcwd() != root_s:
+        os.chdir(root_s)
+    
+    # Add the project root to Python path so backend.* imports resolve
+    if root_s not in sys.path:
+        sys.path.insert(0, root_s)
+    
+    # Emit the startup banner with a single write
+    banner = (
+        _BANNER
+        .replace(b"{port}", str(port).encode())
+        .replace(b"{cwd}", os.getcwd().encode())
+        .replace(b"{path}", str(sys.path[:3]).encode())
+    )
+    sys.stdout.buffer.write(banner)
+    sys.stdout.buffer.flush()
     
-    # Add both project root and backend to Python path
-    sys.path.insert(0, str(project_root))
-    sys.path.insert(0, str(project_root / "backend"))
+    # Access logging goes through the logging module on every request; opt in with ACCESS_LOG=1
+    access_log = os.environ.get("ACCESS_LOG") == "1"
     
-    print(f"🚀 Starting YouTube to Blog Converter API Server on port {port}...")
-    print(f"📂 Working directory: {os.getcwd()}")
-    print(f"🐍 Python path: {sys.path[:3]}")
+    # One worker process per CPU unless WEB_CONCURRENCY overrides it. Each worker
+    # imports backend.main and builds its own services and in-memory caches.
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
     
-    try:
-        # Start the server in production mode
-        uvicorn.run(
-            "backend.main:app",
-            host="0.0.0.0",
-            port=port,
-            workers=1,  # Single worker for hobby plans
-            log_level="info",
-            access_log=True
-        )
-    except Exception as e:
-        print(f"❌ Error starting server: {e}")
-        print("🔍 Trying alternative import...")
-        try:
-            # Alternative approach - change to backend directory
-            os.chdir(project_root / "backend")
-            uvicorn.run(
-                "main:app",
-                host="0.0.0.0",
-                port=port,
-                workers=1,
-                log_level="info"
-            )
-        except Exception as e2:
-            print(f"❌ Alternative start also failed: {e2}")
-            sys.exit(1)
+    # Start the server in production mode; backend.main:app is importable from the project root
+    uvicorn.run(
+        "backend.main:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        reload=False,  # Never run the file watcher in production; use run_server.py for development
+        loop="uvloop",
+        http="httptools",
+        ws="none",
+        lifespan="on",
+        log_level="warning",
+        access_log=access_log,
+        proxy_headers=False,
+        server_header=False,
+        date_header=False,
+        use_colors=False
+    )
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,5 +1,161 @@
-from typing import Dict, Any, List, Tuple, Optional
-from backend.llm_service import LLMService
+import asyncio
+import functools
+import json
+from typing import Dict, Any, List, Tuple, Optional, AsyncIterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from backend.llm_service import LLMService
+
+# Maximum number of characters of transcript/description sent to the LLM
+MAX_CONTENT_CHARS = 4000
+
+# Prompt templates, built once at import. User templates are filled with str.format_map.
+_ARTICLE_SYSTEM_PROMPT = (
+    "You are an expert blog writer specializing in creating engaging, well-structured articles from video content. "
+    "Your tone should be informative yet accessible. You must use Markdown for formatting, including headings, "
+    "subheadings, bold text for emphasis, and bullet points or numbered lists where appropriate."
+)
+
+_ARTICLE_USER_TEMPLATE = """\
+Please generate a high-quality blog article in Markdown format based on the following video information.
+
+**Video Title:** {title}
+**Channel:** {channel}
+**Content Source (from {source_type}):**
+---
+{content}
+---
+
+**Instructions:**
+1.  Create a compelling headline from the video title.
+2.  Write a short, engaging introduction that hooks the reader and states the video's purpose.
+3.  Analyze the provided content source and identify 3-5 main themes, topics, or key takeaways.
+4.  For each key takeaway, create a well-defined section with a descriptive subheading. Elaborate on each point, providing context and explanation.
+5.  Write a thoughtful conclusion that summarizes the main points and provides a final thought for the reader.
+6.  Ensure the entire output is a single, complete blog post in Markdown format. Do not include any of your own commentary, preamble, or postamble.
+"""
+
+_TUTORIAL_SYSTEM_PROMPT = (
+    "You are a technical writer who excels at creating clear, step-by-step tutorials from video content. "
+    "Your goal is to make complex processes easy to follow. You must use Markdown for formatting, especially "
+    "numbered lists for steps, and code blocks for any code examples."
+)
+
+_TUTORIAL_USER_TEMPLATE = """\
+Please generate a step-by-step tutorial in Markdown format based on the following video information.
+
+**Video Title:** {title}
+**Channel:** {channel}
+**Content Source (from {source_type}):**
+---
+{content}
+---
+
+**Instructions:**
+1.  Create a clear, action-oriented headline.
+2.  Write a brief overview of what the tutorial covers and what the user will learn.
+3.  If applicable, list any prerequisites (e.g., software, prior knowledge).
+4.  Analyze the content source and break down the process into a logical sequence of numbered steps.
+5.  For each step, provide a clear heading and a concise explanation of the actions to take.
+6.  Conclude with a summary of what was accomplished.
+7.  Ensure the entire output is a single, complete tutorial in Markdown format.
+"""
+
+_REVIEW_SYSTEM_PROMPT = (
+    "You are a critical reviewer who writes balanced and insightful reviews of products, services, or media shown in videos. "
+    "Your writing should be objective and well-supported. Use Markdown for structure, such as headings for different review criteria (e.g., Pros, Cons)."
+)
+
+_REVIEW_USER_TEMPLATE = """\
+Please generate a detailed review in Markdown format based on the following video.
+
+**Video Title:** {title}
+**Channel:** {channel}
+**Content Source (from {source_type}):**
+---
+{content}
+---
+
+**Instructions:**
+1.  Create a headline for the review.
+2.  Start with a summary of the item being reviewed.
+3.  Analyze the content to identify the key positive aspects (Pros) and negative aspects (Cons). Present these in bulleted lists under respective subheadings.
+4.  Include a section for your 'Verdict' or 'Final Thoughts'.
+5.  Assign a rating out of 5 stars if appropriate.
+6.  The final output must be a single, complete review in Markdown format.
+"""
+
+_SUMMARY_SYSTEM_PROMPT = (
+    "You are an efficient assistant skilled at summarizing video content into concise, easy-to-digest key points. "
+    "Your output should be structured and scannable. Use Markdown, especially bullet points."
+)
+
+_SUMMARY_USER_TEMPLATE = """\
+Please generate a concise summary in Markdown format of the following video.
+
+**Video Title:** {title}
+**Channel:** {channel}
+**Content Source (from {source_type}):**
+---
+{content}
+---
+
+**Instructions:**
+1.  Use the video title as the main heading.
+2.  Provide a one-paragraph overview of the video's main topic.
+3.  Create a bulleted list of the most important key takeaways or highlights from the video. Aim for 5-7 points.
+4.  Keep the language clear and direct.
+5.  The final output must be a single, complete summary in Markdown format.
+"""
+
+# Template name -> (system prompt, user template)
+_TEMPLATES: Dict[str, Tuple[str, str]] = {
+    "article": (_ARTICLE_SYSTEM_PROMPT, _ARTICLE_USER_TEMPLATE),
+    "tutorial": (_TUTORIAL_SYSTEM_PROMPT, _TUTORIAL_USER_TEMPLATE),
+    "review": (_REVIEW_SYSTEM_PROMPT, _REVIEW_USER_TEMPLATE),
+    "summary": (_SUMMARY_SYSTEM_PROMPT, _SUMMARY_USER_TEMPLATE),
+}
+
+# {"role":"system",...} message for each template, JSON-encoded once at import
+_SYSTEM_MESSAGE_BYTES: Dict[str, bytes] = {
+    name: json.dumps({"role": "system", "content": system_prompt}).encode()
+    for name, (system_prompt, _) in _TEMPLATES.items()
+}
+
+@functools.lru_cache(maxsize=128)
+def _select_content_source(transcript: Optional[str], description: str) -> Tuple[str, str]:
+    """
+    Determines the best content source (transcript or description), already truncated for the prompt.
+    Cached on the texts themselves: str hashes are stored on the object, so repeat calls for the
+    same video (e.g. several templates) are a dict lookup.
+    """
+    # Use transcript if it's substantial, otherwise fall back to description.
+    # isspace() scans in place and stops at the first non-space character, so no copy is made.
+    if transcript and len(transcript) > 100 and not transcript.isspace():
+        content_source, source_type = transcript, "video transcript"
+    else:
+        content_source, source_type = description, "video description"
+    if len(content_source) > MAX_CONTENT_CHARS:
+        content_source = content_source[:MAX_CONTENT_CHARS]
+    return content_source, source_type
+
+def _build_prompt(template: str, video_data: Dict[str, Any], transcript: Optional[str]) -> Tuple[str, str]:
+    """
+    Creates the (system, user) prompts for a template via the _TEMPLATES table.
+    Kept as a single fully-annotated function so the prompt path can be compiled (e.g. mypyc).
+    """
+    try:
+        system_prompt, user_template = _TEMPLATES[template]
+    except KeyError:
+        raise ValueError(f"Unknown template: {template}") from None
+    content_source, source_type = _select_content_source(transcript, video_data.get('description', ''))
+    user_prompt = user_template.format_map({
+        "title": video_data.get('title', ''),
+        "channel": video_data.get('channel_name', ''),
+        "source_type": source_type,
+        "content": content_source,
+    })
+    return system_prompt, user_prompt
 
 class BlogGenerator:
     """
@@ -7,159 +163,75 @@ class BlogGenerator:
     and using the LLMService to get the generated content.
     """
     
+    __slots__ = ("_llm_service", "_llm_checked")
+    
+    # Shared, read-only template table
+    templates = _TEMPLATES
+    
     def __init__(self):
-        """Initializes the BlogGenerator and the LLMService."""
-        try:
-            self.llm_service = LLMService()
-            self.llm_enabled = True
-        except ValueError:
-            self.llm_service = None
-            self.llm_enabled = False
-            print("⚠️ WARNING: LLM Service not initialized. NEBIUS_API_KEY may be missing.")
-
-        self.templates = {
-            "article": self._create_article_prompt,
-            "tutorial": self._create_tutorial_prompt,
-            "review": self._create_review_prompt,
-            "summary": self._create_summary_prompt
-        }
+        """Initializes the BlogGenerator; the LLMService is created on first use."""
+        self._llm_service = None
+        self._llm_checked = False
     
+    @property
+    def llm_service(self) -> Optional["LLMService"]:
+        """The LLMService, constructed on first access. None if it could not be initialized."""
+        if not self._llm_checked:
+            from backend.llm_service import LLMService
+            try:
+                self._llm_service = LLMService()
+            except ValueError:
+                print("⚠️ WARNING: LLM Service not initialized. NEBIUS_API_KEY may be missing.")
+            self._llm_checked = True
+        return self._llm_service
+
+    @property
+    def llm_enabled(self) -> bool:
+        """Whether the LLMService is available; triggers its lazy initialization."""
+        return self.llm_service is not None
+
     def generate_blog(self, video_data: Dict[str, Any], template: str, transcript: Optional[str]) -> str:
         """Generate blog content based on template and video data using an LLM."""
         if not self.llm_enabled:
             return "## LLM Service Not Available\n\nPlease ensure your `NEBIUS_API_KEY` is correctly set in your `.env` file and restart the server."
 
-        if template not in self.templates:
-            raise ValueError(f"Unknown template: {template}")
-        
-        # Create the system and user prompts using the appropriate method
-        system_prompt, user_prompt = self.templates[template](video_data, transcript)
+        # Create the user prompt; the system prompt is already encoded in the request body
+        _, user_prompt = _build_prompt(template, video_data, transcript)
         
         # Call the LLM service to generate the blog content
-        return self.llm_service.generate_content(system_prompt, user_prompt)
-
-    def _get_content_source(self, video_data: Dict[str, Any], transcript: Optional[str]) -> Tuple[str, str]:
-        """Determines the best content source (transcript or description) to use for the prompt."""
-        description = video_data.get('description', '')
-        # Use transcript if it's substantial, otherwise fall back to description.
-        if transcript and len(transcript.strip()) > 100:
-            return transcript, "video transcript"
-        return description, "video description"
-
-    def _create_article_prompt(self, video_data: Dict[str, Any], transcript: Optional[str]) -> Tuple[str, str]:
-        """Creates the system and user prompts for a standard article."""
-        system_prompt = (
-            "You are an expert blog writer specializing in creating engaging, well-structured articles from video content. "
-            "Your tone should be informative yet accessible. You must use Markdown for formatting, including headings, "
-            "subheadings, bold text for emphasis, and bullet points or numbered lists where appropriate."
-        )
-        
-        content_source, source_type = self._get_content_source(video_data, transcript)
-
-        user_prompt = f"""
-        Please generate a high-quality blog article in Markdown format based on the following video information.
-
-        **Video Title:** {video_data.get('title')}
-        **Channel:** {video_data.get('channel_name')}
-        **Content Source (from {source_type}):**
-        ---
-        {content_source[:4000]}
-        ---
-        
-        **Instructions:**
-        1.  Create a compelling headline from the video title.
-        2.  Write a short, engaging introduction that hooks the reader and states the video's purpose.
-        3.  Analyze the provided content source and identify 3-5 main themes, topics, or key takeaways.
-        4.  For each key takeaway, create a well-defined section with a descriptive subheading. Elaborate on each point, providing context and explanation.
-        5.  Write a thoughtful conclusion that summarizes the main points and provides a final thought for the reader.
-        6.  Ensure the entire output is a single, complete blog post in Markdown format. Do not include any of your own commentary, preamble, or postamble.
-        """
-        return system_prompt, user_prompt
-
-    def _create_tutorial_prompt(self, video_data: Dict[str, Any], transcript: Optional[str]) -> Tuple[str, str]:
-        """Creates the system and user prompts for a tutorial."""
-        system_prompt = (
-            "You are a technical writer who excels at creating clear, step-by-step tutorials from video content. "
-            "Your goal is to make complex processes easy to follow. You must use Markdown for formatting, especially "
-            "numbered lists for steps, and code blocks for any code examples."
-        )
-        
-        content_source, source_type = self._get_content_source(video_data, transcript)
-
-        user_prompt = f"""
-        Please generate a step-by-step tutorial in Markdown format based on the following video information.
-
-        **Video Title:** {video_data.get('title')}
-        **Channel:** {video_data.get('channel_name')}
-        **Content Source (from {source_type}):**
-        ---
-        {content_source[:4000]}
-        ---
-        
-        **Instructions:**
-        1.  Create a clear, action-oriented headline.
-        2.  Write a brief overview of what the tutorial covers and what the user will learn.
-        3.  If applicable, list any prerequisites (e.g., software, prior knowledge).
-        4.  Analyze the content source and break down the process into a logical sequence of numbered steps.
-        5.  For each step, provide a clear heading and a concise explanation of the actions to take.
-        6.  Conclude with a summary of what was accomplished.
-        7.  Ensure the entire output is a single, complete tutorial in Markdown format.
-        """
-        return system_prompt, user_prompt
-
-    def _create_review_prompt(self, video_data: Dict[str, Any], transcript: Optional[str]) -> Tuple[str, str]:
-        """Creates the system and user prompts for a review."""
-        system_prompt = (
-            "You are a critical reviewer who writes balanced and insightful reviews of products, services, or media shown in videos. "
-            "Your writing should be objective and well-supported. Use Markdown for structure, such as headings for different review criteria (e.g., Pros, Cons)."
+        return self.llm_service.generate_from_body(self.build_request_body(template, user_prompt))
+
+    def build_request_body(self, template: str, user_prompt: str) -> bytes:
+        """Builds a chat completion request body around the pre-encoded system message."""
+        return b"".join((
+            self.llm_service.request_prefix,
+            b',"messages":[',
+            _SYSTEM_MESSAGE_BYTES[template],
+            b',{"role":"user","content":',
+            json.dumps(user_prompt).encode(),
+            b'}]}',
+        ))
+
+    async def generate_blogs(self, video_data: Dict[str, Any], templates: List[str], transcript: Optional[str]) -> Dict[str, str]:
+        """Generate several templates for the same video with concurrent LLM calls."""
+        if not self.llm_enabled:
+            unavailable = "## LLM Service Not Available\n\nPlease ensure your `NEBIUS_API_KEY` is correctly set in your `.env` file and restart the server."
+            return {template: unavailable for template in templates}
+
+        # Deduplicate while keeping the requested order
+        templates = list(dict.fromkeys(templates))
+        prompts = [_build_prompt(template, video_data, transcript) for template in templates]
+        results = await asyncio.gather(
+            *(self.llm_service.agenerate_content(system_prompt, user_prompt) for system_prompt, user_prompt in prompts)
         )
+        return dict(zip(templates, results))
 
-        content_source, source_type = self._get_content_source(video_data, transcript)
-
-        user_prompt = f"""
-        Please generate a detailed review in Markdown format based on the following video.
-
-        **Video Title:** {video_data.get('title')}
-        **Channel:** {video_data.get('channel_name')}
-        **Content Source (from {source_type}):**
-        ---
-        {content_source[:4000]}
-        ---
-        
-        **Instructions:**
-        1.  Create a headline for the review.
-        2.  Start with a summary of the item being reviewed.
-        3.  Analyze the content to identify the key positive aspects (Pros) and negative aspects (Cons). Present these in bulleted lists under respective subheadings.
-        4.  Include a section for your 'Verdict' or 'Final Thoughts'.
-        5.  Assign a rating out of 5 stars if appropriate.
-        6.  The final output must be a single, complete review in Markdown format.
-        """
-        return system_prompt, user_prompt
-
-    def _create_summary_prompt(self, video_data: Dict[str, Any], transcript: Optional[str]) -> Tuple[str, str]:
-        """Creates the system and user prompts for a summary."""
-        system_prompt = (
-            "You are an efficient assistant skilled at summarizing video content into concise, easy-to-digest key points. "
-            "Your output should be structured and scannable. Use Markdown, especially bullet points."
-        )
+    async def generate_blog_stream(self, video_data: Dict[str, Any], template: str, transcript: Optional[str]) -> AsyncIterator[str]:
+        """Stream blog content fragments from the LLM as they are generated."""
+        if not self.llm_enabled:
+            yield "## LLM Service Not Available\n\nPlease ensure your `NEBIUS_API_KEY` is correctly set in your `.env` file and restart the server."
+            return
 
-        content_source, source_type = self._get_content_source(video_data, transcript)
-
-        user_prompt = f"""
-        Please generate a concise summary in Markdown format of the following video.
-
-        **Video Title:** {video_data.get('title')}
-        **Channel:** {video_data.get('channel_name')}
-        **Content Source (from {source_type}):**
-        ---
-        {content_source[:4000]}
-        ---
-
-        **Instructions:**
-        1.  Use the video title as the main heading.
-        2.  Provide a one-paragraph overview of the video's main topic.
-        3.  Create a bulleted list of the most important key takeaways or highlights from the video. Aim for 5-7 points.
-        4.  Keep the language clear and direct.
-        5.  The final output must be a single, complete summary in Markdown format.
-        """
-        return system_prompt, user_prompt
\ No newline at end of file
+        system_prompt, user_prompt = _build_prompt(template, video_data, transcript)
+        async for fragment in self.llm_service.stream_content(system_prompt, user_prompt):
+            yield fragment